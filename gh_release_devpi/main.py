@@ -1,26 +1,62 @@
-import glob
+import functools
 import hashlib
+import mmap
 import os
+import queue
 import re
 import shutil
+import string
+import threading
 import time
 import typing
-from typing import Annotated
-from dotenv import load_dotenv
-from github import Auth, Github, UnknownObjectException
-from github.GitReleaseAsset import GitReleaseAsset
-from requests.auth import HTTPBasicAuth
-from tqdm import tqdm
-import requests
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Annotated
 import typer
 from rich.console import Console
 
-_ = load_dotenv(dotenv_path=os.path.join(os.getcwd(), ".env"))
+# requests / tqdm / dotenv 在使用处延迟导入，加快 --help 与补全等场景的启动速度
+if TYPE_CHECKING:
+    import requests
+    from requests.auth import HTTPBasicAuth
 
 app = typer.Typer(help="GitHub Release Artifact Downloader and DevPI Uploader")
 console = Console()
 
 
+# 可上传的包文件后缀
+_PACKAGE_EXTS = (".whl", ".tar.gz", ".zip", ".egg")
+
+# 下载时不再重试的 HTTP 状态码
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 410})
+
+# wheel 文件名匹配模式，模块级预编译
+_WHEEL_RE = re.compile(r"^([a-zA-Z0-9_]+)-([0-9][a-zA-Z0-9._]*?)-(.*?)\.whl$")
+
+# sdist 后缀及文件名允许的字符，用字符串操作解析，无需正则
+_SDIST_EXTS = (".tar.gz", ".tar.bz2", ".zip", ".egg")
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_VERSION_CHARS = _NAME_CHARS | {"."}
+
+
+def _build_session(pool_size: int = 16) -> "requests.Session":
+    """创建带连接池的 Session，复用 keep-alive 连接，省去重复的 TCP/TLS 握手"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # 不在 adapter 层重试：下载的重试与退避统一由 _requests_get_stream 负责
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.cache
+def _get_session() -> "requests.Session":
+    """GitHub 下载共享的 Session，首次使用时创建"""
+    return _build_session()
+
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
@@ -51,19 +87,24 @@ def extract_package_metadata(filename: str) -> dict[str, str]:
 
     basename = os.path.basename(filename)
 
-    # 尝试匹配 wheel 格式: {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl
-    wheel_pattern = r"^([a-zA-Z0-9_]+)-([0-9][a-zA-Z0-9._]*?)-(.*?)\.whl$"
-    match = re.match(wheel_pattern, basename)
-    if match:
-        return {"name": match.group(1), "version": match.group(2)}
-
-    # 尝试匹配 sdist 格式: {name}-{version}.tar.gz 或 {name}-{version}.zip
-    sdist_pattern = (
-        r"^([a-zA-Z0-9_]+)-([0-9][a-zA-Z0-9._]*?)\.(tar\.gz|zip|tar\.bz2|egg)$"
-    )
-    match = re.match(sdist_pattern, basename)
-    if match:
-        return {"name": match.group(1), "version": match.group(2)}
+    # 先用后缀判断格式，避免对不相干的文件名跑正则
+    if basename.endswith(".whl"):
+        # 尝试匹配 wheel 格式: {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl
+        match = _WHEEL_RE.match(basename)
+        if match:
+            return {"name": match.group(1), "version": match.group(2)}
+    elif basename.endswith(_SDIST_EXTS):
+        # 尝试解析 sdist 格式: {name}-{version}.tar.gz 或 {name}-{version}.zip
+        ext = next(e for e in _SDIST_EXTS if basename.endswith(e))
+        name, sep, version = basename.removesuffix(ext).partition("-")
+        if (
+            sep
+            and name
+            and set(name) <= _NAME_CHARS
+            and version[:1].isdigit()
+            and set(version) <= _VERSION_CHARS
+        ):
+            return {"name": name, "version": version}
 
     # 无法解析，返回空
     console.print(f"[yellow]警告: 无法从文件名解析包信息: {basename}[/yellow]")
@@ -72,15 +113,96 @@ def extract_package_metadata(filename: str) -> dict[str, str]:
 
 def compute_file_hash(file_path: str) -> tuple[str, str]:
     """计算文件的 MD5 和 SHA256"""
-    md5_hash = hashlib.md5()
-    sha256_hash = hashlib.sha256()
-
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            md5_hash.update(chunk)
-            sha256_hash.update(chunk)
+        try:
+            # 内存映射整个文件，由 hashlib 在 C 层遍历，避免 Python 循环；
+            # hashlib 对大缓冲区会释放 GIL，MD5 放到另一线程与 SHA256 并行计算
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                md5_hash = hashlib.md5()
+                sha256_hash = hashlib.sha256()
+                md5_thread = threading.Thread(target=md5_hash.update, args=(mm,))
+                md5_thread.start()
+                sha256_hash.update(mm)
+                md5_thread.join()
+                return md5_hash.hexdigest(), sha256_hash.hexdigest()
+        except (ValueError, OSError, OverflowError):
+            # 空文件或无法映射（如地址空间不足）时回退到 hashlib.file_digest
+            pass
+
+    # 每个摘要各自打开文件，第二次读取命中系统页缓存
+    with open(file_path, "rb") as f:
+        md5_digest = hashlib.file_digest(f, "md5").hexdigest()
+    with open(file_path, "rb") as f:
+        sha256_digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+    return md5_digest, sha256_digest
 
-    return md5_hash.hexdigest(), sha256_hash.hexdigest()
+
+def _upload_one(
+    session: "requests.Session",
+    file_path: str,
+    digests: Future[tuple[str, str]] | None,
+    upload_url: str,
+    auth: "HTTPBasicAuth",
+    proxies: dict[str, str] | None,
+    abort: threading.Event,
+) -> None:
+    """上传单个包文件到 devpi，失败时抛出 RuntimeError
+
+    digests 为后台计算中的 (md5, sha256)，哈希与前一个文件的上传重叠进行；
+    为 None 时不提交摘要，由 devpi 服务端自行计算
+    abort 在任一文件失败后被置位，排队中的文件随后直接跳过，不再上传
+    """
+    import requests
+
+    if abort.is_set():
+        return
+
+    filename = os.path.basename(file_path)
+    console.print(f"[cyan]上传: {filename}...[/cyan]")
+
+    try:
+        # 提取包元数据
+        metadata = extract_package_metadata(filename)
+        with open(file_path, "rb") as f:
+            files: dict[str, tuple[str, typing.BinaryIO, str]] = {
+                "content": (filename, f, "application/octet-stream")
+            }
+
+            # 包含完整的 metadata，参考 twine 的实现
+            data = {
+                ":action": "file_upload",
+                "protocol_version": "1",
+                "name": metadata["name"],
+                "version": metadata["version"],
+                "filetype": "bdist_wheel" if filename.endswith(".whl") else "sdist",
+            }
+            if digests is not None:
+                data["md5_digest"], data["sha256_digest"] = digests.result()
+
+            response = session.post(
+                upload_url,
+                files=files,
+                data=data,
+                auth=auth,
+                proxies=proxies,
+                timeout=60,
+            )
+
+            response.raise_for_status()
+            console.print(f"[green]  ✓ {filename} 上传成功[/green]")
+
+    except requests.exceptions.HTTPError as e:
+        error_msg = f"HTTP {e.response.status_code}"
+        if e.response.text:
+            error_msg += f": {e.response.text[:200]}"
+        abort.set()
+        console.print(f"[red]  ✗ {filename} 上传失败: {error_msg}[/red]")
+        raise RuntimeError(f"上传 {filename} 失败: {error_msg}")
+    except Exception as e:
+        abort.set()
+        console.print(f"[red]  ✗ {filename} 上传失败: {e}[/red]")
+        raise RuntimeError(f"上传 {filename} 失败: {e}")
 
 
 def upload_to_devpi(
@@ -90,8 +212,11 @@ def upload_to_devpi(
     devpi_index: str = "dev",
     artifacts_dir: str = "artifacts",
     use_proxy: bool = False,
+    compute_hashes: bool = False,
 ) -> None:
     """使用 requests 直接上传文件到 devpi"""
+    from requests.auth import HTTPBasicAuth
+
     if not devpi_server:
         raise RuntimeError("必须指定 devpi_server 参数")
 
@@ -107,10 +232,13 @@ def upload_to_devpi(
     if not use_proxy:
         console.print("[cyan]已禁用代理[/cyan]")
 
-    # 查找所有包文件
+    # 查找所有包文件（单次扫描目录，按后缀过滤）；非目录路径视为没有包文件
     package_files: list[str] = []
-    for ext in ["*.whl", "*.tar.gz", "*.zip", "*.egg"]:
-        package_files.extend(glob.glob(os.path.join(artifacts_dir, ext)))
+    if os.path.isdir(artifacts_dir):
+        with os.scandir(artifacts_dir) as it:
+            package_files = sorted(
+                e.path for e in it if e.is_file() and e.name.endswith(_PACKAGE_EXTS)
+            )
 
     if not package_files:
         console.print("[yellow]未找到任何包文件（.whl, .tar.gz, .zip, .egg）[/yellow]")
@@ -118,55 +246,46 @@ def upload_to_devpi(
 
     console.print(f"[cyan]找到 {len(package_files)} 个包文件[/cyan]")
 
-    # 上传每个文件
+    # 并发上传，共享 Session 以复用 TCP/TLS 连接；
+    # 并发数固定为 4，避免压垮 devpi 服务器
     success_count = 0
-    for file_path in package_files:
-        filename = os.path.basename(file_path)
-        console.print(f"[cyan]上传: {filename}...[/cyan]")
-
-        try:
-            # 提取包元数据
-            metadata = extract_package_metadata(filename)
-            md5_digest, sha256_digest = compute_file_hash(file_path)
-
-            with open(file_path, "rb") as f:
-                files: dict[str, tuple[str, typing.BinaryIO, str]] = {
-                    "content": (filename, f, "application/octet-stream")
-                }
-
-                # 包含完整的 metadata，参考 twine 的实现
-                data = {
-                    ":action": "file_upload",
-                    "protocol_version": "1",
-                    "name": metadata["name"],
-                    "version": metadata["version"],
-                    "md5_digest": md5_digest,
-                    "sha256_digest": sha256_digest,
-                    "filetype": "bdist_wheel" if filename.endswith(".whl") else "sdist",
-                }
-
-                response = requests.post(
+    abort = threading.Event()
+    with _build_session(pool_size=8) as session:
+        # 单独的哈希线程按顺序预先计算摘要，把哈希耗时隐藏在网络传输之后；
+        # 摘要字段是可选的，默认跳过以省去每个文件一次完整读取
+        with (
+            ThreadPoolExecutor(max_workers=1) as hash_ex,
+            ThreadPoolExecutor(max_workers=min(4, len(package_files))) as ex,
+        ):
+            futures = [
+                ex.submit(
+                    _upload_one,
+                    session,
+                    file_path,
+                    (
+                        hash_ex.submit(compute_file_hash, file_path)
+                        if compute_hashes
+                        else None
+                    ),
                     upload_url,
-                    files=files,
-                    data=data,
-                    auth=auth,
-                    proxies=proxies,
-                    timeout=60,
+                    auth,
+                    proxies,
+                    abort,
                 )
-
-                response.raise_for_status()
-                console.print(f"[green]  ✓ {filename} 上传成功[/green]")
-                success_count += 1
-
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP {e.response.status_code}"
-            if e.response.text:
-                error_msg += f": {e.response.text[:200]}"
-            console.print(f"[red]  ✗ {filename} 上传失败: {error_msg}[/red]")
-            raise RuntimeError(f"上传 {filename} 失败: {error_msg}")
-        except Exception as e:
-            console.print(f"[red]  ✗ {filename} 上传失败: {e}[/red]")
-            raise RuntimeError(f"上传 {filename} 失败: {e}")
+                for file_path in package_files
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    success_count += 1
+            except BaseException:
+                # 任一文件失败即停止后续上传，与逐个上传时遇错即停的行为一致：
+                # 已被 worker 取走的文件由 abort 跳过，队列中的任务直接取消；
+                # 先停止哈希线程，避免在等待进行中的上传时继续哈希排队的文件
+                abort.set()
+                hash_ex.shutdown(cancel_futures=True)
+                ex.shutdown(cancel_futures=True)
+                raise
 
     console.print(
         f"[green]✅ 上传成功！({success_count}/{len(package_files)} 个文件)[/green]"
@@ -179,11 +298,19 @@ def _requests_get_stream(
     dest_path: str,
     max_retries: int = 2,
     timeout: int = 30,
+    position: int | None = None,
+    session: "requests.Session | None" = None,
 ) -> Exception | None:
+    import requests
+    from tqdm import tqdm
+
+    if session is None:
+        session = _get_session()
+
     last_exc: Exception | None = None
     for attempt in range(1, max_retries + 1):
         try:
-            with requests.get(
+            with session.get(
                 url, headers=headers, stream=True, timeout=timeout, allow_redirects=True
             ) as r:
                 r.raise_for_status()
@@ -193,57 +320,132 @@ def _requests_get_stream(
                     int(r.headers.get("content-length", 0)) or None
                 )  # None 表示未知大小
 
+                # 仅在服务端声明了压缩编码时才解码，二进制 wheel 直接读取原始字节
+                r.raw.decode_content = "content-encoding" in r.headers
+
                 with open(dest_path, "wb") as f:
-                    # 初始化 tqdm 进度条
-                    with tqdm(
+                    # 包装 f.write 以更新 tqdm 进度条，拷贝循环交给 shutil 完成；
+                    # 每次 write 为 1 MiB，mininterval 进一步合并多个进度条的刷新
+                    with tqdm.wrapattr(
+                        f,
+                        "write",
                         total=total_size,
                         unit="B",
                         unit_scale=True,
                         unit_divisor=1024,
                         desc=dest_path.split("/")[-1] or "Downloading",
-                        leave=True,
-                    ) as pbar:
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:
-                                _ = f.write(chunk)  # type: ignore[arg-type]
-                                _ = pbar.update(len(chunk))  # type: ignore[arg-type]
+                        position=position,
+                        leave=position is None,
+                        mininterval=0.5,
+                    ) as fout:
+                        shutil.copyfileobj(
+                            r.raw, typing.cast(typing.BinaryIO, fout), length=1 << 20
+                        )
 
             return None  # success
 
+        except requests.HTTPError as exc:
+            last_exc = exc
+            # 4xx 等永久性错误重试也不会成功，直接返回
+            if (
+                exc.response is not None
+                and exc.response.status_code in _NON_RETRYABLE_STATUS
+            ):
+                break
+            if attempt < max_retries:
+                time.sleep(0.5 * attempt)
         except Exception as exc:
             last_exc = exc
             # small backoff
-            time.sleep(0.5 * attempt)
+            if attempt < max_retries:
+                time.sleep(0.5 * attempt)
 
     return last_exc
 
 
+def fetch_latest_release(
+    repo_name: str, token: str, session: "requests.Session | None" = None
+) -> dict[str, typing.Any] | None:
+    """
+    通过 REST API 获取最新 release，响应中已内联全部 assets，只需一次请求
+    仓库没有 release 时返回 None；仓库不存在或 token 无权访问时抛出 RuntimeError
+    """
+    if session is None:
+        session = _get_session()
+    api_url = f"https://api.github.com/repos/{repo_name}"
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github+json",
+    }
+    r = session.get(f"{api_url}/releases/latest", headers=headers, timeout=30)
+    if r.status_code == 404:
+        # 仓库不存在时同样返回 404，确认仓库可访问后才视为没有 release
+        repo_r = session.get(api_url, headers=headers, timeout=30)
+        if repo_r.status_code == 404:
+            message = repo_r.json().get("message", "Not Found")
+            raise RuntimeError(
+                f"无法访问仓库 {repo_name} (仓库不存在或 token 无权访问): {message}"
+            )
+        repo_r.raise_for_status()
+        return None
+    r.raise_for_status()
+    return r.json()
+
+
 def download_asset(
-    asset: GitReleaseAsset, token: str, dest_dir: str = "artifacts"
+    asset: dict[str, typing.Any],
+    token: str,
+    dest_dir: str = "artifacts",
+    position: int | None = None,
+    session: "requests.Session | None" = None,
 ) -> str:
     """
     更稳健的 release asset 下载：
-    1) 优先使用 asset.url (API endpoint) + Accept: application/octet-stream (官方方式)
+    1) 优先使用 asset["browser_download_url"] 直连 CDN，不占用 API 配额且少一次 302 跳转
+       (仅公开仓库可用，私有仓库会返回 404，此时不会重试)
+    2) 回退到 asset["url"] (API endpoint) + Accept: application/octet-stream (官方方式)
     返回保存的文件路径或抛出异常
+    调用方需保证 dest_dir 已存在（download 命令中由 clear_artifacts_dir 创建）
     """
-    ensure_dir(dest_dir)
-    filename = os.path.join(dest_dir, asset.name)
+    filename = os.path.join(dest_dir, asset["name"])
+
+    # 公开仓库直接走 CDN，CDN 不需要也不校验 token
+    browser_url: str | None = asset.get("browser_download_url")
+    if browser_url:
+        err = _requests_get_stream(
+            browser_url,
+            {"Accept": "application/octet-stream"},
+            filename,
+            position=position,
+            session=session,
+        )
+        if err is None:
+            return filename
 
     # 使用 API 下载端点 (recommended)
-    api_url: str = (
-        asset.url
-    )  # e.g. https://api.github.com/repos/owner/repo/releases/assets/12345
+    # e.g. https://api.github.com/repos/owner/repo/releases/assets/12345
+    api_url: str = asset["url"]
     headers_api: dict[str, str] = {
         "Authorization": f"token {token}",
         "Accept": "application/octet-stream",
     }
 
-    err = _requests_get_stream(api_url, headers_api, filename)
+    err = _requests_get_stream(
+        api_url, headers_api, filename, position=position, session=session
+    )
     if err is None:
         return filename
 
     # 失败，抛出带上下文的异常
-    raise RuntimeError(f"Failed to download asset {asset.name}.")
+    raise RuntimeError(f"Failed to download asset {asset['name']}.")
+
+
+@app.callback()
+def _load_env() -> None:
+    # 在子命令解析参数（envvar）之前加载 .env
+    from dotenv import load_dotenv
+
+    _ = load_dotenv(dotenv_path=os.path.join(os.getcwd(), ".env"))
 
 
 @app.command()
@@ -316,6 +518,23 @@ def download(
     skip_upload: Annotated[
         bool, typer.Option("--skip-upload", help="跳过上传到 DevPI")
     ] = False,
+    upload_compute_hashes: Annotated[
+        bool,
+        typer.Option(
+            "--upload-compute-hashes/--no-upload-compute-hashes",
+            envvar="DEVPI_COMPUTE_HASHES",
+            help="上传时计算并提交 MD5/SHA256 摘要 (默认不计算, 由 DevPI 服务端计算)",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="并发下载的 asset 数量 (默认: 4, 过高可能触发 GitHub 限流)",
+        ),
+    ] = 4,
 ) -> None:
     """
     从 GitHub Release 下载 artifacts 并可选上传到 DevPI
@@ -333,25 +552,20 @@ def download(
         raise typer.Exit(code=1)
 
     try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
-        repo = g.get_repo(repo_name)
-
-        try:
-            latest_release = repo.get_latest_release()
-        except UnknownObjectException:
+        latest_release = fetch_latest_release(repo_name, token)
+        if latest_release is None:
             console.print(f"[red]仓库 {repo_name} 没有 Release。[/red]")
             raise typer.Exit(code=1)
 
         console.print("[bold green]最新 release:[/bold green]")
         console.print(
-            f"  [cyan]name:[/cyan] {latest_release.name or latest_release.tag_name}"
+            f"  [cyan]name:[/cyan] {latest_release['name'] or latest_release['tag_name']}"
         )
-        console.print(f"  [cyan]tag_name:[/cyan] {latest_release.tag_name}")
-        console.print(f"  [cyan]published_at:[/cyan] {latest_release.published_at}")
-        console.print(f"  [cyan]url:[/cyan] {latest_release.html_url}")
+        console.print(f"  [cyan]tag_name:[/cyan] {latest_release['tag_name']}")
+        console.print(f"  [cyan]published_at:[/cyan] {latest_release['published_at']}")
+        console.print(f"  [cyan]url:[/cyan] {latest_release['html_url']}")
 
-        assets = list(latest_release.get_assets())
+        assets: list[dict[str, typing.Any]] = latest_release.get("assets", [])
         if not assets:
             console.print("[yellow]该 release 没有 assets（artifact）。[/yellow]")
             raise typer.Exit(code=0)
@@ -359,7 +573,7 @@ def download(
         console.print(f"\n[bold]找到 {len(assets)} 个 asset:[/bold]")
         for i, a in enumerate(assets, start=1):
             console.print(
-                f" {i}. [green]{a.name}[/green]  size={format_size(a.size)}  created_at={a.created_at}"
+                f" {i}. [green]{a['name']}[/green]  size={format_size(a['size'])}  created_at={a['created_at']}"
             )
 
         # 清空 artifacts 目录
@@ -369,13 +583,38 @@ def download(
             f"\n[bold cyan]开始下载 assets 到 ./{artifacts_dir}/ ...[/bold cyan]"
         )
         failed_downloads: list[str] = []
-        for a in assets:
+        # 并发下载；进度条位置按 worker 槽位分配，最多占用 workers 行，避免互相覆盖
+        workers = min(jobs, len(assets))
+        bar_slots: queue.Queue[int] = queue.Queue()
+        for slot in range(workers):
+            bar_slots.put(slot)
+
+        def _download_in_slot(asset: dict[str, typing.Any]) -> str:
+            slot = bar_slots.get()
+            try:
+                return download_asset(
+                    asset, token, dest_dir=artifacts_dir, position=slot
+                )
+            finally:
+                bar_slots.put(slot)
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(_download_in_slot, a): a for a in assets}
             try:
-                saved = download_asset(a, token, dest_dir=artifacts_dir)
-                console.print(f"  [green]✓ 下载完成:[/green] {saved}")
-            except Exception as exc:
-                console.print(f"  [red]✗ 下载失败:[/red] {a.name} — {repr(exc)}")
-                failed_downloads.append(a.name)
+                for future in as_completed(futures):
+                    a = futures[future]
+                    try:
+                        saved = future.result()
+                        console.print(f"  [green]✓ 下载完成:[/green] {saved}")
+                    except Exception as exc:
+                        console.print(
+                            f"  [red]✗ 下载失败:[/red] {a['name']} — {repr(exc)}"
+                        )
+                        failed_downloads.append(a["name"])
+            except BaseException:
+                # Ctrl-C 等中断时取消尚未开始的下载，不再等待整个队列跑完
+                ex.shutdown(cancel_futures=True)
+                raise
 
         if failed_downloads:
             console.print(
@@ -393,6 +632,7 @@ def download(
                     devpi_index=devpi_index,
                     artifacts_dir=artifacts_dir,
                     use_proxy=devpi_use_proxy,
+                    compute_hashes=upload_compute_hashes,
                 )
             except Exception as e:
                 console.print(f"[red]❌ 上传失败: {e}[/red]")
@@ -424,6 +664,7 @@ def upload(
     - DEVPI_USER: DevPI 用户名 (默认: root)
     - DEVPI_INDEX: DevPI 索引名称 (默认: dev)
     - DEVPI_USE_PROXY: 是否使用代理 (默认: false)
+    - DEVPI_COMPUTE_HASHES: 是否计算并提交文件摘要 (默认: false)
     """
     # 1. 验证目录是否存在
     if not os.path.exists(artifacts_dir):
@@ -449,6 +690,7 @@ def upload(
     devpi_user = os.getenv("DEVPI_USER", "root")
     devpi_index = os.getenv("DEVPI_INDEX", "dev")
     devpi_use_proxy = os.getenv("DEVPI_USE_PROXY", "false").lower() == "true"
+    devpi_compute_hashes = os.getenv("DEVPI_COMPUTE_HASHES", "false").lower() == "true"
 
     # 4. 显示配置信息
     console.print("[bold green]DevPI 上传配置:[/bold green]")
@@ -457,6 +699,9 @@ def upload(
     console.print(f"  [cyan]索引:[/cyan] {devpi_index}")
     console.print(f"  [cyan]目录:[/cyan] {artifacts_dir}")
     console.print(f"  [cyan]代理:[/cyan] {'启用' if devpi_use_proxy else '禁用'}")
+    console.print(
+        f"  [cyan]摘要:[/cyan] {'计算' if devpi_compute_hashes else '由服务端计算'}"
+    )
     console.print("")
 
     # 5. 执行上传
@@ -468,6 +713,7 @@ def upload(
             devpi_index=devpi_index,
             artifacts_dir=artifacts_dir,
             use_proxy=devpi_use_proxy,
+            compute_hashes=devpi_compute_hashes,
         )
         console.print("\n[bold green]✅ 上传任务完成！[/bold green]")
     except Exception as e: